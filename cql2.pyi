@@ -13,8 +13,8 @@ def parse_file(path: PathLike | str) -> Expr:
         Expr: The CQL2 expression
 
     Examples:
-        >>> from cql2 import Expr
-        >>> expr = Expr.parse_file("fixtures/text/example01.txt")
+        >>> import cql2
+        >>> expr = cql2.parse_file("examples/text/example01.txt")
     """
 
 def parse_text(s: str) -> Expr:
@@ -30,8 +30,8 @@ def parse_text(s: str) -> Expr:
         ParseError: Raised if the string does not parse as cql2-text
 
     Examples:
-        >>> from cql2 import Expr
-        >>> expr = Expr.parse_text("landsat:scene_id = 'LC82030282019133LGN00'")
+        >>> import cql2
+        >>> expr = cql2.parse_text("landsat:scene_id = 'LC82030282019133LGN00'")
     """
 
 def parse_json(s: str) -> Expr:
@@ -47,8 +47,8 @@ def parse_json(s: str) -> Expr:
         ParseError: Raised if the string does not parse as cql2-json
 
     Examples:
-        >>> from cql2 import Expr
-        >>> expr = Expr.parse_json('{"op":"=","args":[{"property":"landsat:scene_id"},"LC82030282019133LGN00"]}')
+        >>> import cql2
+        >>> expr = cql2.parse_json('{"op":"=","args":[{"property":"landsat:scene_id"},"LC82030282019133LGN00"]}')
     """
 
 class Expr:
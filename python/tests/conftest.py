@@ -1,22 +1,48 @@
+# Session-scoped fixtures are shared by every test, so tests must not mutate the
+# values they return.
+
+import functools
 import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
+import cql2
 import pytest
 
+_FIXTURES = Path(__file__).resolve().parents[2] / "examples"
+
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def fixtures() -> Path:
-    return Path(__file__).parents[2] / "examples"
+    return _FIXTURES
+
 
+@pytest.fixture(scope="session")
+def example01_path(fixtures: Path) -> Path:
+    return fixtures / "text" / "example01.txt"
 
-@pytest.fixture
-def example01_text(fixtures: Path) -> str:
-    with open(fixtures / "text" / "example01.txt") as f:
-        return f.read()
 
+@pytest.fixture(scope="session")
+def example01_text(example01_path: Path) -> str:
+    return example01_path.read_text()
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def example01_json(fixtures: Path) -> dict[str, Any]:
-    with open(fixtures / "json" / "example01.json") as f:
-        return json.load(f)
+    return json.loads((fixtures / "json" / "example01.json").read_bytes())
+
+
+@pytest.fixture(scope="session")
+def example01_json_str(example01_json: dict[str, Any]) -> str:
+    return json.dumps(example01_json, separators=(",", ":"))
+
+
+@pytest.fixture(scope="session")
+def example01_expr(example01_text: str) -> cql2.Expr:
+    return cql2.Expr(example01_text)
+
+
+@pytest.fixture(scope="session")
+def cached_expr() -> Callable[[str], cql2.Expr]:
+    return functools.cache(cql2.Expr)
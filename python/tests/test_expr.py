@@ -1,53 +1,75 @@
-import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Any
 
 import cql2
 import pytest
 
+Parser = Callable[[str], cql2.Expr]
+
+MALFORMED_JSON = "not json"
+MALFORMED_TEXT = '{"op":...}'
+PARSERS = [
+    (cql2.parse_json, cql2.parse_text),
+    (cql2.Expr, cql2.Expr),
+]
+
+
+@pytest.fixture(params=PARSERS, ids=["module", "Expr"])
+def api(request: pytest.FixtureRequest) -> tuple[Parser, Parser]:
+    return request.param
+
 
 def test_version() -> None:
     assert isinstance(cql2.__version__, str)
     assert len(cql2.__version__.split(".")) == 3
 
 
-def test_parse_file(fixtures: Path) -> None:
-    cql2.parse_file(fixtures / "text" / "example01.txt")
+def test_parse_file(example01_path: Path) -> None:
+    cql2.parse_file(example01_path)
+    cql2.parse_file(str(example01_path))
 
 
-def test_parse_file_str(fixtures: Path) -> None:
-    cql2.parse_file(str(fixtures / "text" / "example01.txt"))
+def test_parse_json(
+    api: tuple[Parser, Parser],
+    example01_json_str: str,
+    example01_json: dict[str, Any],
+) -> None:
+    parse_json, _ = api
+    assert parse_json(example01_json_str).to_json() == example01_json
 
 
-def test_init(example01_text: str) -> None:
-    cql2.Expr(example01_text)
+def test_parse_json_error() -> None:
+    with pytest.raises(cql2.ParseError, match="expected .* at line 1 column"):
+        cql2.parse_json(MALFORMED_JSON)
 
 
-def test_parse_json(example01_text: str, example01_json: dict[str, Any]) -> None:
-    cql2.parse_json(json.dumps(example01_json))
-    with pytest.raises(cql2.ParseError):
-        cql2.parse_json(example01_text)
+def test_parse_text(
+    api: tuple[Parser, Parser], example01_text: str, example01_json: dict[str, Any]
+) -> None:
+    _, parse_text = api
+    assert parse_text(example01_text).to_json() == example01_json
 
 
-def test_parse_text(example01_text: str, example01_json: dict[str, Any]) -> None:
-    cql2.parse_text(example01_text)
-    with pytest.raises(cql2.ParseError):
-        cql2.parse_text(json.dumps(example01_json))
+def test_parse_text_error() -> None:
+    with pytest.raises(cql2.ParseError, match="expected Expr"):
+        cql2.parse_text(MALFORMED_TEXT)
 
 
-def test_to_json(example01_text: str) -> None:
-    cql2.Expr(example01_text).to_json() == {
+def test_to_json(example01_expr: cql2.Expr) -> None:
+    assert example01_expr.to_json() == {
         "op": "=",
         "args": [{"property": "landsat:scene_id"}, "LC82030282019133LGN00"],
     }
 
 
 def test_to_text(example01_json: dict[str, Any]) -> None:
-    cql2.Expr(example01_json).to_text() == "landsat:scene_id = 'LC82030282019133LGN00'"
+    text = cql2.Expr(example01_json).to_text()
+    assert text == "(\"landsat:scene_id\" = 'LC82030282019133LGN00')"
 
 
-def test_to_sql(example01_text: str) -> None:
-    sql = cql2.Expr(example01_text).to_sql()
+def test_to_sql(example01_expr: cql2.Expr) -> None:
+    sql = example01_expr.to_sql()
     assert sql == "\"landsat:scene_id\" = 'LC82030282019133LGN00'"
 
 
@@ -62,12 +84,12 @@ def test_validate() -> None:
         expr.validate()
 
 
-def test_add() -> None:
-    assert cql2.Expr("True") + cql2.Expr("false") == cql2.Expr("true AND false")
+def test_add(cached_expr: Parser) -> None:
+    assert cached_expr("True") + cached_expr("false") == cached_expr("true AND false")
 
 
-def test_eq() -> None:
-    assert cql2.Expr("True") == cql2.Expr("true")
+def test_eq(cached_expr: Parser) -> None:
+    assert cached_expr("True") == cached_expr("true")
 
 
 def test_str() -> None:
@@ -119,5 +141,5 @@ def test_repr() -> None:
         ),
     ],
 )
-def test_matches(expr, item, should_match) -> None:
-    assert cql2.Expr(expr).matches(item) == should_match
+def test_matches(cached_expr: Parser, expr, item, should_match) -> None:
+    assert cached_expr(expr).matches(item) == should_match